@@ -1,7 +1,14 @@
+import os
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from aiohttp import web
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .nodes import (
     SynologyCheckpointLoader,
     SynologyDiffusionModelLoader,
@@ -15,7 +22,7 @@ from .nodes import (
     SynologyUpscalerLoader,
     SynologyCLIPVisionLoader,
 )
-from .client import get_client, SynologyAuthError, SynologyError
+from .client import get_client, wait_for_client, SynologyAuthError, SynologyError
 
 logger = logging.getLogger("comfyui-synology")
 
@@ -57,16 +64,37 @@ WEB_DIRECTORY = "./js"
 # API Routes
 # ---------------------------------------------------------------------------
 
+# Blocking NAS calls from the routes run on their own pool so a burst of
+# browse/list requests neither starves nor is starved by ComfyUI's default executor.
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("SYNOLOGY_THREAD_POOL_SIZE", "32")),
+    thread_name_prefix="synology-route",
+)
+
+
+async def _run(fn, *args):
+    """Run a blocking client call on the route executor."""
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+
+
+def _json_response(data, status=200):
+    """web.json_response, serialized with orjson when it is installed."""
+    if orjson is None:
+        return web.json_response(data, status=status)
+    return web.Response(body=orjson.dumps(data), status=status, content_type="application/json")
+
+
 ALLOWED_FOLDERS = {"checkpoints", "diffusion_models", "loras", "vae", "controlnet", "clip", "embeddings", "upscale_models", "clip_vision"}
+SORTED_FOLDERS = tuple(sorted(ALLOWED_FOLDERS))
+_ALLOWED_MSG = "Invalid folder. Allowed: " + ", ".join(SORTED_FOLDERS)
 
 try:
     from server import PromptServer
 
     @PromptServer.instance.routes.get("/synology/status")
     async def synology_status(request):
-        loop = asyncio.get_event_loop()
-        client = await loop.run_in_executor(None, get_client)
-        return web.json_response({
+        client = await _run(wait_for_client)
+        return _json_response({
             "authenticated": client.authenticated,
             "user": client.username,
             "api_url": client.api_url,
@@ -80,47 +108,44 @@ try:
         password = data.get("password", "")
 
         if not api_url or not username or not password:
-            return web.json_response(
+            return _json_response(
                 {"error": "api_url, username, and password are required"},
                 status=400,
             )
 
-        loop = asyncio.get_event_loop()
         try:
-            client = await loop.run_in_executor(None, get_client)
-            await loop.run_in_executor(None, lambda: client.login(username, password, api_url, persist=True))
-            return web.json_response({
+            client = get_client()
+            await _run(lambda: client.login(username, password, api_url, persist=True))
+            return _json_response({
                 "authenticated": True,
                 "user": client.username,
             })
         except SynologyAuthError as e:
-            return web.json_response({"error": str(e)}, status=401)
+            return _json_response({"error": str(e)}, status=401)
         except Exception as e:
             logger.error(f"Login error: {e}")
-            return web.json_response({"error": f"Connection failed: {e}"}, status=502)
+            return _json_response({"error": f"Connection failed: {e}"}, status=502)
 
     @PromptServer.instance.routes.post("/synology/logout")
     async def synology_logout(request):
-        loop = asyncio.get_event_loop()
-        client = await loop.run_in_executor(None, get_client)
-        await loop.run_in_executor(None, client.logout)
-        return web.json_response({"authenticated": False})
+        client = get_client()
+        await _run(client.logout)
+        return _json_response({"authenticated": False})
 
     @PromptServer.instance.routes.get("/synology/browse")
     async def synology_browse(request):
         path = request.query.get("path", "/")
-        loop = asyncio.get_event_loop()
         try:
-            client = await loop.run_in_executor(None, get_client)
-            dirs = await loop.run_in_executor(None, client.list_directory, path)
-            return web.json_response({"path": path, "directories": dirs})
+            client = await _run(wait_for_client)
+            dirs = await _run(client.list_directory, path)
+            return _json_response({"path": path, "directories": dirs})
         except SynologyAuthError as e:
-            return web.json_response({"error": str(e)}, status=401)
+            return _json_response({"error": str(e)}, status=401)
         except SynologyError as e:
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
         except Exception as e:
             logger.error(f"Browse error for path {path}: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
 
     @PromptServer.instance.routes.post("/synology/folder-path")
     async def synology_set_folder_path(request):
@@ -129,56 +154,53 @@ try:
         path = data.get("path", "")
 
         if folder not in ALLOWED_FOLDERS:
-            return web.json_response(
-                {"error": f"Invalid folder. Allowed: {', '.join(sorted(ALLOWED_FOLDERS))}"},
+            return _json_response(
+                {"error": _ALLOWED_MSG},
                 status=400,
             )
         if not path:
-            return web.json_response({"error": "path is required"}, status=400)
+            return _json_response({"error": "path is required"}, status=400)
 
-        loop = asyncio.get_event_loop()
-        client = await loop.run_in_executor(None, get_client)
-        await loop.run_in_executor(None, client.set_folder_path, folder, path)
-        return web.json_response({
+        client = get_client()
+        # Drops the folder's listing file, which may sit on a network mount
+        await _run(client.set_folder_path, folder, path)
+        return _json_response({
             "folder": folder,
             "path": client.get_folder_path(folder),
         })
 
     @PromptServer.instance.routes.get("/synology/folder-paths")
     async def synology_get_folder_paths(request):
-        loop = asyncio.get_event_loop()
-        client = await loop.run_in_executor(None, get_client)
-        paths = {f: client.get_folder_path(f) for f in sorted(ALLOWED_FOLDERS)}
-        return web.json_response(paths)
+        client = get_client()
+        return _json_response(client.get_folder_paths(SORTED_FOLDERS))
 
     @PromptServer.instance.routes.post("/synology/refresh-models")
     async def synology_refresh_models(request):
-        loop = asyncio.get_event_loop()
-        client = await loop.run_in_executor(None, get_client)
-        await loop.run_in_executor(None, client.refresh_models)
-        return web.json_response({"ok": True})
+        client = get_client()
+        # Deletes the listing files, which may sit on a network mount
+        await _run(client.refresh_models)
+        return _json_response({"ok": True})
 
     @PromptServer.instance.routes.get("/synology/models/{folder}")
     async def synology_models(request):
         folder = request.match_info["folder"]
         if folder not in ALLOWED_FOLDERS:
-            return web.json_response(
-                {"error": f"Invalid folder. Allowed: {', '.join(sorted(ALLOWED_FOLDERS))}"},
+            return _json_response(
+                {"error": _ALLOWED_MSG},
                 status=400,
             )
 
-        loop = asyncio.get_event_loop()
         try:
-            client = await loop.run_in_executor(None, get_client)
-            models = await loop.run_in_executor(None, client.list_models, folder)
-            return web.json_response({"models": models})
+            client = await _run(wait_for_client)
+            models = await _run(client.list_models, folder)
+            return _json_response({"models": models})
         except SynologyAuthError as e:
-            return web.json_response({"error": str(e)}, status=401)
+            return _json_response({"error": str(e)}, status=401)
         except SynologyError as e:
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
         except Exception as e:
             logger.error(f"Models list error for {folder}: {e}")
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
 
 except ImportError:
     logger.warning("PromptServer not available — API routes not registered")
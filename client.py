@@ -1,11 +1,85 @@
 import os
+import atexit
+import ssl
+import copy
+import json
+import time
 import threading
 import logging
-import yaml
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from operator import itemgetter
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 logger = logging.getLogger("comfyui-synology")
 
+# File extensions list_models treats as model files.
+MODEL_EXTENSIONS = frozenset(("safetensors", "ckpt", "pt", "pth", "bin"))
+
+# Max directory listings in flight at once while walking a model folder.
+LIST_CONCURRENCY = 16
+
+# Model folders listed right after auto-login so the editor's first load is warm.
+PREWARM_FOLDERS = ("checkpoints", "loras", "vae", "controlnet")
+
+# Directories scanned at once when measuring the cache size.
+SIZE_SCAN_CONCURRENCY = 8
+
+# Max model files fetched at once by download_models and the multi-LoRA loader.
+DOWNLOAD_CONCURRENCY = 3
+
+# Attempts per download_model call; each retry resumes the partial file.
+DOWNLOAD_ATTEMPTS = 3
+
+# Seconds a cached model stays trusted before it is re-checked against the NAS.
+CACHE_VALIDATE_TTL = 600
+
+# Most recently used cached models per folder kept warm in the background
+# after that folder is listed.
+PREFETCH_RECENT = 3
+
+# Seconds get_model_list_safe reuses a folder's list before asking the client
+# again, and the shorter time it reuses a "(login required)"/error placeholder
+# so the dropdowns recover quickly without hammering an unreachable NAS.
+MODEL_LIST_TTL = 30.0
+PLACEHOLDER_TTL = 5.0
+
+# Seconds get_model_list_safe waits for startup auto-login before showing
+# "(login required)". It runs on the server's event loop, so keep this short.
+CLIENT_READY_WAIT = 0.5
+
+# Seconds to wait for a TCP connection to the NAS. Kept short so an
+# unreachable NAS fails fast; read timeouts are set per call.
+CONNECT_TIMEOUT = 3.05
+
+# NAS paths per FileStation getinfo request, keeping the query string short.
+GETINFO_BATCH = 50
+
+# Seconds to wait for further changes before writing config.yaml.
+PERSIST_DELAY = 0.5
+
+# CGI path under /webapi/ for each API, used until SYNO.API.Info says otherwise.
+_DEFAULT_ENDPOINTS = {
+    "SYNO.API.Auth": "auth.cgi",
+    "SYNO.FileStation.List": "entry.cgi",
+    "SYNO.FileStation.Download": "entry.cgi",
+}
+
+# Fixed parts of the FileStation request parameters; call sites add the rest.
+_LOGIN_PARAMS = {"api": "SYNO.API.Auth", "version": "3", "method": "login", "session": "FileStation", "format": "sid"}
+_LOGOUT_PARAMS = {"api": "SYNO.API.Auth", "version": "1", "method": "logout", "session": "FileStation"}
+_LIST_SHARE_PARAMS = {"api": "SYNO.FileStation.List", "version": "2", "method": "list_share"}
+_LIST_PARAMS = {"api": "SYNO.FileStation.List", "version": "2", "method": "list"}
+_GETINFO_PARAMS = {"api": "SYNO.FileStation.List", "version": "2", "method": "getinfo", "additional": json.dumps(["size", "time"])}
+_DOWNLOAD_PARAMS = {"api": "SYNO.FileStation.Download", "version": "2", "method": "download", "mode": "download"}
+
 # ---------------------------------------------------------------------------
 # Exceptions
 # ---------------------------------------------------------------------------
@@ -29,11 +103,30 @@ class SessionExpiredError(SynologyError):
 # Config
 # ---------------------------------------------------------------------------
 
+_yaml_mod = None
+
+def _yaml():
+    """Import PyYAML on first use, which only happens if config.yaml is read or
+    written. Returns (yaml, Loader, Dumper), preferring the LibYAML-backed pair."""
+    global _yaml_mod
+    if _yaml_mod is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+        _yaml_mod = (yaml, loader, dumper)
+    return _yaml_mod
+
 def _config_path():
     return os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
 
+_config_cache = None  # (mtime_ns, size, parsed config) of the last config.yaml read
+
 def load_config():
-    """Load config from config.yaml, then let env vars override."""
+    """Load config from config.yaml, then let env vars override.
+    The parsed file is cached until its mtime or size changes."""
+    global _config_cache
     config = {
         "api_url": "",
         "username": "",
@@ -41,17 +134,29 @@ def load_config():
         "models_base_path": "/volume1/models",
         "folder_paths": {},
         "cache_dir": "",
+        "verify_ssl": False,
+        "ca_bundle": "",
     }
     path = _config_path()
-    if os.path.exists(path):
-        try:
-            with open(path, "r") as f:
-                file_config = yaml.safe_load(f) or {}
-            for key in config:
-                if key in file_config and file_config[key]:
-                    config[key] = file_config[key]
-        except Exception as e:
-            logger.warning(f"Failed to read config.yaml: {e}")
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is not None:
+        cached = _config_cache
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            config = copy.deepcopy(cached[2])
+        else:
+            try:
+                yaml, loader, _dumper = _yaml()
+                with open(path, "r") as f:
+                    file_config = yaml.load(f, Loader=loader) or {}
+                for key in config:
+                    if key in file_config and file_config[key]:
+                        config[key] = file_config[key]
+                _config_cache = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+            except Exception as e:
+                logger.warning(f"Failed to read config.yaml: {e}")
 
     env_map = {
         "SYNOLOGY_API_URL": "api_url",
@@ -68,10 +173,13 @@ def load_config():
 
 def save_config(config):
     """Write config dict back to config.yaml."""
+    global _config_cache
+    _config_cache = None
     path = _config_path()
     try:
+        yaml, _loader, dumper = _yaml()
         with open(path, "w") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
         logger.info(f"Saved config to {path}")
     except Exception as e:
         logger.warning(f"Failed to save config.yaml: {e}")
@@ -87,12 +195,90 @@ def _default_cache_dir():
     except ImportError:
         return os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
 
+def _write_all(fd, data):
+    """os.write until every byte of data is written."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _dir_size(path):
+    """Return (bytes in path's files, [subdirectory paths]) from one scandir."""
+    total = 0
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                total += entry.stat(follow_symlinks=False).st_size
+    return total, subdirs
+
+def _tree_size(path):
+    """Total size in bytes of the files under path. Directories are scanned
+    concurrently so per-file stat latency overlaps when the cache lives on a
+    network mount."""
+    total = 0
+    with ThreadPoolExecutor(max_workers=SIZE_SCAN_CONCURRENCY, thread_name_prefix="synology-du") as pool:
+        pending = {pool.submit(_dir_size, path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                size, subdirs = future.result()
+                total += size
+                pending.update(pool.submit(_dir_size, d) for d in subdirs)
+    return total
+
+def _is_connect_error(e):
+    """True if a requests/urllib3 error means no connection was made."""
+    if isinstance(e, requests.ConnectTimeout):
+        return True
+    reason = getattr(e.args[0], "reason", None) if e.args else None
+    return isinstance(reason, urllib3.exceptions.ConnectTimeoutError)
+
+def _fsync_dir(path):
+    """fsync a directory so a rename into it survives a crash. No-op where
+    directories can't be opened (Windows)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        dfd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(dfd)
+    except OSError:
+        pass
+    finally:
+        os.close(dfd)
+
+def _build_ssl_context(verify):
+    """Build the one SSL context shared by every connection the client opens.
+    Synology units typically serve a self-signed certificate, so verification
+    is off unless the config opts in. verify may be a CA bundle path to trust."""
+    ctx = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+    if not verify:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools reuse a prebuilt SSL context."""
+    def __init__(self, ssl_context, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
 # ---------------------------------------------------------------------------
 # Client
 # ---------------------------------------------------------------------------
 
 class SynologyClient:
-    def __init__(self, cache_dir=None):
+    def __init__(self, cache_dir=None, verify_ssl=False, config=None):
+        self._config_doc = config if config is not None else load_config()
         self._lock = threading.Lock()
         self._sid = None
         self._api_url = None
@@ -101,8 +287,47 @@ class SynologyClient:
         self._models_base_path = "/volume1/models"
         self._folder_paths = {}  # folder -> custom NAS path
         self._cache_dir = cache_dir or _default_cache_dir()
-        self._model_cache = {}  # folder -> [filenames]
+        # folder -> [filenames]. Never mutated in place: writers swap in a new
+        # dict, so readers can use it without taking a lock.
+        self._model_cache = {}
+        self._made_dirs = set()  # cache directories already created by _ensure_dir
         self._auth_version = 0
+        self._endpoints = None  # (api_url, {api: cgi path}) from SYNO.API.Info
+        self._persist_lock = threading.Lock()
+        self._persist_timer = None
+        self._dirty = False
+        self._inflight_lock = threading.Lock()
+        self._inflight_list = {}  # folder -> Future of an in-progress list_models
+        self._inflight_dl = {}  # (folder, filename) -> Future of an in-progress download
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="synology-prefetch")
+        self._prefetch_queued = set()  # (folder, filename) submitted and not yet finished
+        # Shared keep-alive session so repeated FileStation calls reuse one
+        # TCP/TLS connection instead of handshaking on every request.
+        # True, False or a CA bundle path, as requests' verify= expects.
+        self._verify = verify_ssl if isinstance(verify_ssl, str) else bool(verify_ssl)
+        try:
+            ssl_context = _build_ssl_context(self._verify)
+        except (OSError, ssl.SSLError) as e:
+            # A missing or unreadable ca_bundle must not take the client down
+            # with it; verify against the system store instead.
+            logger.warning(f"Could not load CA bundle {self._verify!r}, using system certificates: {e}")
+            self._verify = True
+            ssl_context = _build_ssl_context(True)
+        if not self._verify:
+            # urllib3 would otherwise warn on every request to the NAS.
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        self._session = requests.Session()
+        adapter = _SSLContextAdapter(
+            ssl_context,
+            pool_connections=4,
+            pool_maxsize=LIST_CONCURRENCY,
+            # No connect retries: an unreachable NAS should fail after one
+            # CONNECT_TIMEOUT, not several plus backoff.
+            max_retries=Retry(total=3, connect=0, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._list_pool = ThreadPoolExecutor(max_workers=LIST_CONCURRENCY, thread_name_prefix="synology-list")
 
     # -- public properties --------------------------------------------------
 
@@ -127,20 +352,26 @@ class SynologyClient:
         return self._cache_dir
 
     def refresh_models(self):
-        """Clear the in-memory model list cache so the next list_models call re-fetches."""
-        self._model_cache.clear()
+        """Clear the model list caches so the next list_models call re-walks the NAS."""
+        self._model_cache = {}
+        self._drop_listing()
         self._auth_version += 1
         logger.info("Refreshed model list cache")
 
+    def cache_size(self):
+        """Total bytes currently held in the local cache directory."""
+        if not os.path.isdir(self._cache_dir):
+            return 0
+        return _tree_size(self._cache_dir)
+
     def clear_cache(self):
         """Delete all cached model files and return the number of bytes freed."""
         import shutil
         freed = 0
         if os.path.isdir(self._cache_dir):
-            for dirpath, _dirnames, filenames in os.walk(self._cache_dir):
-                for f in filenames:
-                    freed += os.path.getsize(os.path.join(dirpath, f))
+            freed = _tree_size(self._cache_dir)
             shutil.rmtree(self._cache_dir)
+            self._made_dirs = set()
             os.makedirs(self._cache_dir, exist_ok=True)
             logger.info(f"Cleared cache: freed {freed / (1024 * 1024):.1f} MB")
         return freed
@@ -148,14 +379,82 @@ class SynologyClient:
     # -- config persistence -------------------------------------------------
 
     def _persist_config(self):
-        """Save current credentials and folder paths to config.yaml."""
-        config = load_config()
+        """Schedule a write of credentials and folder paths to config.yaml.
+        Calls within PERSIST_DELAY of each other coalesce into one write."""
+        with self._persist_lock:
+            self._dirty = True
+            if self._persist_timer is not None:
+                self._persist_timer.cancel()
+            self._persist_timer = threading.Timer(PERSIST_DELAY, self._flush_config)
+            self._persist_timer.start()
+
+    def _flush_config(self):
+        """Write any pending config changes now."""
+        with self._persist_lock:
+            if self._persist_timer is not None:
+                self._persist_timer.cancel()
+                self._persist_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._persist_config_now()
+
+    def _persist_config_now(self):
+        """Save current credentials and folder paths to config.yaml.
+        Merges into the config held in memory, so other keys are preserved
+        without re-reading the file."""
+        config = self._config_doc
         config["api_url"] = self._api_url or ""
         config["username"] = self._username or ""
         config["password"] = self._password or ""
         config["folder_paths"] = dict(self._folder_paths)
         save_config(config)
 
+    # -- listing cache ------------------------------------------------------
+
+    def _listing_path(self, folder):
+        return os.path.join(self._cache_dir, f"listing-{folder}.json")
+
+    def _read_listing(self, folder, base_path):
+        """Return the on-disk listing for folder ({"path", "dirs", "results"})
+        if it was taken from base_path, else None."""
+        try:
+            with open(self._listing_path(folder), "r") as f:
+                listing = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if listing.get("path") != base_path or not isinstance(listing.get("dirs"), dict):
+            return None
+        return listing
+
+    def _ensure_dir(self, path, force=False):
+        """os.makedirs, skipped for directories this client already created."""
+        if force or path not in self._made_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._made_dirs.add(path)
+
+    def _write_listing(self, folder, base_path, dirs, results):
+        try:
+            self._ensure_dir(self._cache_dir)
+            with open(self._listing_path(folder), "w") as f:
+                json.dump({"path": base_path, "dirs": dirs, "results": results}, f)
+        except OSError as e:
+            logger.warning(f"Failed to write model listing for {folder}: {e}")
+
+    def _drop_listing(self, folder=None):
+        """Delete the on-disk model list for folder, or for every folder if None."""
+        if folder is not None:
+            names = [os.path.basename(self._listing_path(folder))]
+        elif os.path.isdir(self._cache_dir):
+            names = [n for n in os.listdir(self._cache_dir) if n.startswith("listing-") and n.endswith(".json")]
+        else:
+            names = []
+        for name in names:
+            try:
+                os.remove(os.path.join(self._cache_dir, name))
+            except FileNotFoundError:
+                pass
+
     # -- auth ---------------------------------------------------------------
 
     def login(self, username, password, api_url=None, persist=False):
@@ -173,30 +472,51 @@ class SynologyClient:
             if persist:
                 self._persist_config()
 
+    def _discover_endpoints(self):
+        """Ask SYNO.API.Info where each API is served, once per NAS URL.
+        Until that succeeds, requests go to the standard DSM paths."""
+        if self._endpoints is not None and self._endpoints[0] == self._api_url:
+            return
+        try:
+            resp = self._get(
+                f"{self._api_url}/webapi/query.cgi",
+                params={"api": "SYNO.API.Info", "version": "1", "method": "query", "query": ",".join(_DEFAULT_ENDPOINTS)},
+                timeout=(CONNECT_TIMEOUT, 15),
+            )
+            resp.raise_for_status()
+            data = _loads(resp.content)
+        except requests.ConnectionError:
+            raise  # the NAS is unreachable; login would only fail the same way
+        except (requests.RequestException, ValueError) as e:
+            logger.debug(f"API discovery failed, using default endpoints: {e}")
+            return
+        if not data.get("success"):
+            return
+        paths = {api: info["path"] for api, info in data.get("data", {}).items() if info.get("path")}
+        self._endpoints = (self._api_url, paths)
+
+    def _url(self, api):
+        """Full URL of the CGI serving api on the current NAS."""
+        endpoints = self._endpoints
+        path = endpoints[1].get(api) if endpoints is not None and endpoints[0] == self._api_url else None
+        return f"{self._api_url}/webapi/{path or _DEFAULT_ENDPOINTS[api]}"
+
     def _do_login(self):
         """Internal login — caller must hold self._lock."""
-        resp = requests.get(
-            f"{self._api_url}/webapi/auth.cgi",
-            params={
-                "api": "SYNO.API.Auth",
-                "version": "3",
-                "method": "login",
-                "account": self._username,
-                "passwd": self._password,
-                "session": "FileStation",
-                "format": "sid",
-            },
-            timeout=15,
-            verify=False,
+        self._discover_endpoints()
+        resp = self._get(
+            self._url("SYNO.API.Auth"),
+            params={**_LOGIN_PARAMS, "account": self._username, "passwd": self._password},
+            timeout=(CONNECT_TIMEOUT, 15),
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
         if not data.get("success"):
             code = data.get("error", {}).get("code")
             raise SynologyAuthError(f"Login failed (error code: {code})")
 
         self._sid = data["data"]["sid"]
-        self._model_cache.clear()
+        self._model_cache = {}
         self._auth_version += 1
         logger.info(f"Logged in to Synology as {self._username}")
 
@@ -204,17 +524,10 @@ class SynologyClient:
         with self._lock:
             if self._sid and self._api_url:
                 try:
-                    requests.get(
-                        f"{self._api_url}/webapi/auth.cgi",
-                        params={
-                            "api": "SYNO.API.Auth",
-                            "version": "1",
-                            "method": "logout",
-                            "session": "FileStation",
-                            "_sid": self._sid,
-                        },
-                        timeout=10,
-                        verify=False,
+                    self._get(
+                        self._url("SYNO.API.Auth"),
+                        params={**_LOGOUT_PARAMS, "_sid": self._sid},
+                        timeout=(CONNECT_TIMEOUT, 10),
                     )
                 except Exception:
                     pass  # best-effort
@@ -222,20 +535,68 @@ class SynologyClient:
             self._sid = None
             self._username = None
             self._password = None
-            self._model_cache.clear()
+            self._model_cache = {}
+            self._drop_listing()
             self._auth_version += 1
             self._persist_config()
+            self._flush_config()
             logger.info("Logged out of Synology")
 
+    def _get(self, url, **kwargs):
+        # verify is passed per call: a session-level setting loses to
+        # REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE when requests merges env settings.
+        return self._session.get(url, verify=self._verify, **kwargs)
+
+    # -- in-flight deduplication ---------------------------------------------
+
+    def _single_flight(self, table, key, fn):
+        """Run fn once per key at a time; concurrent callers with the same key
+        wait for and share the first caller's result."""
+        with self._inflight_lock:
+            future = table.get(key)
+            owner = future is None
+            if owner:
+                future = table[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del table[key]
+
+    # -- shutdown ------------------------------------------------------------
+
+    def close(self):
+        """Flush pending config writes and release pooled connections and threads.
+        Logout keeps the connection pool warm for the next login; this is for
+        process shutdown."""
+        self._flush_config()
+        self._list_pool.shutdown(wait=False)
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
     # -- session retry wrapper ----------------------------------------------
 
     def _with_session_retry(self, fn):
-        """Execute fn; on error 119 (session expired), re-auth and retry once."""
+        """Execute fn; on error 119 (session expired), re-auth and retry once.
+        If another thread already re-authenticated while fn was running, the
+        fresh session is reused instead of logging in again."""
+        sid = self._sid
         try:
             return fn()
         except SessionExpiredError:
             with self._lock:
-                if self._username and self._password:
+                if self._sid and self._sid != sid:
+                    pass  # someone else already logged in again
+                elif self._username and self._password:
                     logger.info("Session expired, re-authenticating...")
                     self._do_login()
                 else:
@@ -266,13 +627,23 @@ class SynologyClient:
         """Return the custom NAS path for a folder type, or empty string if not set."""
         return self._folder_paths.get(folder, "")
 
+    def get_folder_paths(self, folders):
+        """Return {folder: custom NAS path or ""} for each folder type given."""
+        paths = self._folder_paths
+        return {f: paths.get(f, "") for f in folders}
+
     def set_folder_path(self, folder, path):
-        """Set a custom NAS path for a folder type. Clears cached models for that folder."""
-        if path:
-            self._folder_paths[folder] = path.rstrip("/")
+        """Set a custom NAS path for a folder type. Clears cached models for that folder
+        unless the normalized path is unchanged."""
+        new = path.rstrip("/") if path else None
+        if new == self._folder_paths.get(folder):
+            return
+        if new:
+            self._folder_paths[folder] = new
         else:
             self._folder_paths.pop(folder, None)
-        self._model_cache.pop(folder, None)
+        self._model_cache = {k: v for k, v in self._model_cache.items() if k != folder}
+        self._drop_listing(folder)
         self._auth_version += 1
         self._persist_config()
 
@@ -280,26 +651,21 @@ class SynologyClient:
         """List top-level shared folders (volumes) on the NAS."""
         def _do():
             self._require_auth()
-            resp = requests.get(
-                f"{self._api_url}/webapi/entry.cgi",
-                params={
-                    "api": "SYNO.FileStation.List",
-                    "version": "2",
-                    "method": "list_share",
-                    "_sid": self._sid,
-                },
-                timeout=30,
-                verify=False,
+            resp = self._get(
+                self._url("SYNO.FileStation.List"),
+                params={**_LIST_SHARE_PARAMS, "_sid": self._sid},
+                timeout=(CONNECT_TIMEOUT, 30),
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = _loads(resp.content)
             self._check_response(data)
 
             shares = [
                 {"name": s["name"], "path": s["path"]}
-                for s in data.get("data", {}).get("shares", [])
+                for s in data.get("data", {}).get("shares", ())
             ]
-            return sorted(shares, key=lambda s: s["name"])
+            shares.sort(key=itemgetter("name"))
+            return shares
 
         return self._with_session_retry(_do)
 
@@ -310,73 +676,187 @@ class SynologyClient:
             return self.list_shares()
 
         def _do():
-            self._require_auth()
-            resp = requests.get(
-                f"{self._api_url}/webapi/entry.cgi",
-                params={
-                    "api": "SYNO.FileStation.List",
-                    "version": "2",
-                    "method": "list",
-                    "folder_path": path,
-                    "_sid": self._sid,
-                },
-                timeout=30,
-                verify=False,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            self._check_response(data)
-
             dirs = [
                 {"name": f["name"], "path": f["path"]}
-                for f in data.get("data", {}).get("files", [])
+                for f in self._list_folder(path)
                 if f.get("isdir", False)
             ]
-            return sorted(dirs, key=lambda d: d["name"])
+            dirs.sort(key=itemgetter("name"))
+            return dirs
 
         return self._with_session_retry(_do)
 
     def _list_folder(self, path):
         """List all entries (files and dirs) at a NAS path."""
         self._require_auth()
-        resp = requests.get(
-            f"{self._api_url}/webapi/entry.cgi",
-            params={
-                "api": "SYNO.FileStation.List",
-                "version": "2",
-                "method": "list",
-                "folder_path": path,
-                "_sid": self._sid,
-            },
-            timeout=30,
-            verify=False,
+        resp = self._get(
+            self._url("SYNO.FileStation.List"),
+            params={**_LIST_PARAMS, "folder_path": path, "_sid": self._sid},
+            timeout=(CONNECT_TIMEOUT, 30),
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
         self._check_response(data)
-        return data.get("data", {}).get("files", [])
+        return data.get("data", {}).get("files", ())
+
+    def prewarm(self, folders=PREWARM_FOLDERS):
+        """List several model folders in parallel to populate the model cache,
+        so the first INPUT_TYPES calls are cache hits. Errors are logged and skipped."""
+        def _one(folder):
+            try:
+                self.list_models(folder)
+            except Exception as e:
+                logger.debug(f"Prewarm of {folder} skipped: {e}")
+
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="synology-prewarm") as pool:
+            list(pool.map(_one, folders))
+
+    def prefetch(self, folder, filename):
+        """Queue a background download_model so a later load is a cache hit.
+        Runs one file at a time; errors are logged and dropped."""
+        key = (folder, filename)
+        with self._inflight_lock:
+            if key in self._prefetch_queued:
+                return
+            self._prefetch_queued.add(key)
+
+        def _do():
+            try:
+                self.download_model(folder, filename)
+            except Exception as e:
+                logger.debug(f"Prefetch of {folder}/{filename} skipped: {e}")
+            finally:
+                with self._inflight_lock:
+                    self._prefetch_queued.discard(key)
+
+        try:
+            self._prefetch_pool.submit(_do)
+        except RuntimeError:  # pool shut down
+            with self._inflight_lock:
+                self._prefetch_queued.discard(key)
+
+    def _prefetch_recent(self, folder, models):
+        """Re-validate the PREFETCH_RECENT most recently used cached files of a
+        folder that are still on the NAS, refreshing any that went stale.
+        The cache scan itself runs on the prefetch pool, off the caller's thread."""
+        def _do():
+            try:
+                self._scan_recent(folder, models)
+            except Exception as e:
+                logger.debug(f"Prefetch scan of {folder} skipped: {e}")
+
+        try:
+            self._prefetch_pool.submit(_do)
+        except RuntimeError:  # pool shut down
+            pass
+
+    def _scan_recent(self, folder, models):
+        """Queue prefetches of a folder's most recently used cached files."""
+        cache_folder = os.path.join(self._cache_dir, folder)
+        if not os.path.isdir(cache_folder):
+            return
+        listed = set(models)
+        recent = []
+        for dirpath, _dirnames, filenames in os.walk(cache_folder):
+            for f in filenames:
+                _stem, dot, ext = f.rpartition(".")
+                if not dot or ext.lower() not in MODEL_EXTENSIONS:
+                    continue
+                local_path = os.path.join(dirpath, f)
+                relative = os.path.relpath(local_path, cache_folder).replace(os.sep, "/")
+                if relative not in listed:
+                    continue
+                try:
+                    st = os.stat(local_path)
+                except OSError:
+                    continue
+                # atime is often frozen by relatime/noatime; mtime covers fresh downloads.
+                recent.append((max(st.st_atime, st.st_mtime), relative))
+        recent.sort(reverse=True)
+        for _used, relative in recent[:PREFETCH_RECENT]:
+            self.prefetch(folder, relative)
+
+    def _stat_remote(self, path):
+        """Return (size, mtime) for a NAS file or directory."""
+        return self._stat_remote_many([path])[path]
+
+    def _stat_remote_many(self, paths):
+        """Return {path: (size, mtime)} for NAS files or directories, asking
+        for GETINFO_BATCH paths per request. Unknown values are None."""
+        self._require_auth()
+        stats = {}
+        for i in range(0, len(paths), GETINFO_BATCH):
+            batch = paths[i:i + GETINFO_BATCH]
+            resp = self._get(
+                self._url("SYNO.FileStation.List"),
+                params={**_GETINFO_PARAMS, "path": json.dumps(batch), "_sid": self._sid},
+                timeout=(CONNECT_TIMEOUT, 30),
+            )
+            resp.raise_for_status()
+            data = _loads(resp.content)
+            self._check_response(data)
+            for f in data.get("data", {}).get("files", ()):
+                additional = f.get("additional", {})
+                stats[f.get("path")] = (additional.get("size"), additional.get("time", {}).get("mtime"))
+        return {p: stats.get(p, (None, None)) for p in paths}
 
     def list_models(self, folder):
         """List model files in a NAS folder, recursing into subdirectories.
         Returns paths relative to the folder root (e.g. 'subdir/model.safetensors').
-        Results are cached."""
-        if folder in self._model_cache:
-            return self._model_cache[folder]
+        Results are cached in memory, and on disk together with the NAS mtime
+        of every directory walked, so restarts skip the walk while none of
+        those directories has changed."""
+        cached = self._model_cache.get(folder)
+        if cached is not None:
+            return cached
 
         def _do():
             base_path = self._resolve_folder_path(folder)
+            listing = self._read_listing(folder, base_path)
+            if listing is not None:
+                # A directory's mtime only changes with its direct children,
+                # so every directory in the tree is checked, in one request.
+                dirs = listing["dirs"]
+                try:
+                    stats = self._stat_remote_many(list(dirs))
+                except SynologyAPIError as e:
+                    # Can't validate it (e.g. a walked directory is gone); re-walk
+                    logger.debug(f"Could not validate model listing for {folder}: {e}")
+                    self._drop_listing(folder)
+                    stats = None
+                if stats is not None and all(
+                        mtime is not None and stats[path][1] == mtime for path, mtime in dirs.items()):
+                    cached = listing.get("results") or []
+                    self._model_cache = {**self._model_cache, folder: cached}
+                    self._prefetch_recent(folder, cached)
+                    return cached
+
             results = []
-            stack = [base_path]
-
-            while stack:
-                current = stack.pop()
-                entries = self._list_folder(current)
-                for entry in entries:
-                    if entry.get("isdir", False):
-                        stack.append(entry["path"])
-                    else:
+            dirs = {}
+            level = [base_path]
+
+            # Walk breadth-first, listing every directory at a given depth
+            # concurrently so wall time scales with tree depth, not size.
+            # Each level's mtimes are taken before it is listed, so a change
+            # made mid-walk shows up as a mismatch on the next check.
+            while level:
+                try:
+                    stats = self._stat_remote_many(level)
+                except SynologyAPIError as e:
+                    # The mtimes only feed the on-disk listing, which is then skipped
+                    logger.debug(f"Could not stat {folder} directories: {e}")
+                    stats = {}
+                for path in level:
+                    dirs[path] = stats.get(path, (None, None))[1]
+                next_level = []
+                for entries in self._list_pool.map(self._list_folder, level):
+                    for entry in entries:
+                        if entry.get("isdir", False):
+                            next_level.append(entry["path"])
+                            continue
                         name = entry.get("name", "")
-                        if not name.lower().endswith((".safetensors", ".ckpt", ".pt", ".pth", ".bin")):
+                        _stem, dot, ext = name.rpartition(".")
+                        if not dot or ext.lower() not in MODEL_EXTENSIONS:
                             continue
                         # Build path relative to the base folder
                         full = entry["path"]
@@ -385,72 +865,245 @@ class SynologyClient:
                         else:
                             relative = name
                         results.append(relative)
+                level = next_level
 
-            self._model_cache[folder] = sorted(results)
-            return self._model_cache[folder]
+            results.sort()
+            self._model_cache = {**self._model_cache, folder: results}
+            if all(mtime is not None for mtime in dirs.values()):
+                self._write_listing(folder, base_path, dirs, results)
+            self._prefetch_recent(folder, results)
+            return results
 
-        return self._with_session_retry(_do)
+        return self._single_flight(self._inflight_list, folder, lambda: self._with_session_retry(_do))
+
+    def _write_cache_meta(self, local_path, size, mtime):
+        """Record the NAS size/mtime a cached file was last validated against."""
+        try:
+            with open(local_path + ".meta", "w") as f:
+                json.dump({"size": size, "mtime": mtime, "checked": time.time()}, f)
+        except OSError as e:
+            logger.warning(f"Failed to write cache metadata for {local_path}: {e}")
+
+    def _cached_copy_is_current(self, local_path, remote_path, st):
+        """Check a cached file (with os.stat result st) against the NAS copy's
+        size and mtime. A .meta sidecar skips the check for CACHE_VALIDATE_TTL
+        seconds; when the NAS can't be asked (logged out, unreachable) the
+        cached copy is trusted."""
+        try:
+            with open(local_path + ".meta", "r") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+        if meta and meta.get("size") == st.st_size and time.time() - meta.get("checked", 0) < CACHE_VALIDATE_TTL:
+            return True
+        if not self._sid:
+            return True
+
+        try:
+            size, mtime = self._with_session_retry(lambda: self._stat_remote(remote_path))
+        except Exception as e:
+            logger.warning(f"Could not validate cached {local_path}, using it as-is: {e}")
+            return True
+        if size is None:
+            # getinfo gave no details (moved/removed on the NAS, per-path error)
+            logger.warning(f"Could not validate cached {local_path}, using it as-is: no size from NAS")
+            return True
+        if size != st.st_size or (mtime is not None and st.st_mtime < mtime):
+            logger.info(f"Cached copy is stale: {local_path}")
+            return False
+        self._write_cache_meta(local_path, size, mtime)
+        return True
 
     def download_model(self, folder, filename, progress_callback=None):
         """Download a model file from the NAS. Returns the local cache path.
-        Skips download if the file is already cached.
+        Skips download if the file is already cached and still matches the NAS copy.
         progress_callback(bytes_downloaded, total_bytes) is called during download."""
         cache_folder = os.path.join(self._cache_dir, folder)
         local_path = os.path.join(cache_folder, filename)
+        remote_path = f"{self._resolve_folder_path(folder)}/{filename}"
 
-        if os.path.exists(local_path):
+        try:
+            st = os.stat(local_path)
+        except FileNotFoundError:
+            st = None
+        if st is not None and self._cached_copy_is_current(local_path, remote_path, st):
             logger.info(f"Cache hit: {local_path}")
             return local_path
 
-        def _do():
-            self._require_auth()
-            remote_path = f"{self._resolve_folder_path(folder)}/{filename}"
-            resp = requests.get(
-                f"{self._api_url}/webapi/entry.cgi",
-                params={
-                    "api": "SYNO.FileStation.Download",
-                    "version": "2",
-                    "method": "download",
-                    "path": remote_path,
-                    "mode": "download",
-                    "_sid": self._sid,
-                },
-                timeout=600,
+        local_dir = os.path.dirname(local_path)
+        tmp_path = local_path + ".tmp"
+        part_path = local_path + ".part"  # validators of the download in tmp_path
+
+        def _request(offset, part):
+            headers = {}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                # Only resume if the NAS file is still the one we started on
+                validator = part.get("etag") or part.get("last_modified")
+                if validator:
+                    headers["If-Range"] = validator
+            return self._get(
+                self._url("SYNO.FileStation.Download"),
+                params={**_DOWNLOAD_PARAMS, "path": remote_path, "_sid": self._sid},
+                headers=headers,
+                timeout=(CONNECT_TIMEOUT, 600),
                 stream=True,
-                verify=False,
             )
+
+        def _fetch():
+            # Pick up a partial download left by an interrupted attempt.
+            try:
+                offset = os.path.getsize(tmp_path)
+                with open(part_path, "r") as f:
+                    part = json.load(f)
+            except (OSError, ValueError):
+                offset, part = 0, {}
+            # A partial as large as the whole file was preallocated and then
+            # killed before it could be trimmed; its contents can't be trusted.
+            if not 0 < offset < part.get("total", 0):
+                offset = 0
+
+            resp = _request(offset, part)
+            if resp.status_code == 416:  # NAS file shrank
+                resp.close()
+                offset = 0
+                resp = _request(0, part)
             resp.raise_for_status()
 
             # JSON content-type means the API returned an error, not a file
             content_type = resp.headers.get("Content-Type", "")
             if "application/json" in content_type:
-                data = resp.json()
+                data = _loads(resp.content)
                 self._check_response(data)
                 raise SynologyAPIError("Download returned unexpected JSON response")
 
-            total_size = int(resp.headers.get("Content-Length", 0))
-            downloaded = 0
-
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            tmp_path = local_path + ".tmp"
+            length = int(resp.headers.get("Content-Length", 0))
+            if offset and resp.status_code == 206:
+                # Content-Range: bytes <start>-<end>/<total>
+                content_range = resp.headers.get("Content-Range", "")
+                start = content_range.partition(" ")[2].partition("-")[0]
+                if start != str(offset) or content_range.rpartition("/")[2] != str(part["total"]):
+                    resp.close()
+                    offset = 0
+                    resp = _request(0, part)
+                    resp.raise_for_status()
+                    length = int(resp.headers.get("Content-Length", 0))
+            else:
+                offset = 0  # full body: the NAS ignored Range or the file changed
+            total_size = offset + length
+            downloaded = offset
+
+            if offset:
+                logger.info(f"Resuming {remote_path} at {offset / (1024 * 1024):.1f} MB")
+            else:
+                try:
+                    with open(part_path, "w") as f:
+                        json.dump({
+                            "etag": resp.headers.get("ETag"),
+                            "last_modified": resp.headers.get("Last-Modified"),
+                            "total": total_size,
+                        }, f)
+                except OSError as e:
+                    logger.warning(f"Failed to record partial download state for {local_path}: {e}")
+
+            flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            try:
+                fd = os.open(tmp_path, flags, 0o644)
+            except FileNotFoundError:
+                # Cache directory was removed behind our back
+                self._ensure_dir(local_dir, force=True)
+                fd = os.open(tmp_path, flags, 0o644)
             try:
-                with open(tmp_path, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8 * 1024 * 1024):
+                if offset:
+                    os.lseek(fd, offset, os.SEEK_SET)
+                else:
+                    os.ftruncate(fd, 0)
+                    # Reserve the full size up front so the file gets contiguous extents.
+                    if total_size > 0 and hasattr(os, "posix_fallocate"):
+                        try:
+                            os.posix_fallocate(fd, 0, total_size)
+                        except OSError:
+                            pass  # not supported by this filesystem
+                try:
+                    for chunk in resp.raw.stream(8 * 1024 * 1024, decode_content=True):
                         if chunk:
-                            f.write(chunk)
+                            _write_all(fd, chunk)
                             downloaded += len(chunk)
                             if progress_callback and total_size > 0:
                                 progress_callback(downloaded, total_size)
-                os.rename(tmp_path, local_path)
-            except Exception:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-                raise
+                except BaseException:
+                    # Trim the preallocated tail so the next attempt resumes
+                    # from the last byte actually received.
+                    os.ftruncate(fd, downloaded)
+                    raise
+                if length and downloaded < total_size:
+                    # urllib3 1.x doesn't enforce Content-Length; a short body
+                    # is an interrupted one, kept as a partial for the retry.
+                    os.ftruncate(fd, downloaded)
+                    raise urllib3.exceptions.ProtocolError(
+                        f"Connection closed after {downloaded} of {total_size} bytes")
+                if downloaded != total_size:
+                    os.ftruncate(fd, downloaded)  # no Content-Length: drop the unused reservation
+                os.fsync(fd)
+                # Model files are multi-GB and get re-read by the loader via
+                # mmap; don't leave a second copy pinned in the page cache.
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, local_path)
+            _fsync_dir(local_dir)
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            return downloaded
 
+        def _do():
+            self._require_auth()
+            self._ensure_dir(local_dir)
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                try:
+                    downloaded = _fetch()
+                    break
+                except (requests.ConnectionError, requests.Timeout, urllib3.exceptions.HTTPError) as e:
+                    # Retries resume an interrupted body; a NAS that can't be
+                    # reached at all fails at once.
+                    if attempt == DOWNLOAD_ATTEMPTS - 1 or _is_connect_error(e):
+                        raise
+                    logger.warning(f"Download of {remote_path} interrupted ({e}), retrying")
+
+            self._write_cache_meta(local_path, downloaded, None)
             logger.info(f"Downloaded: {remote_path} -> {local_path}")
             return local_path
 
-        return self._with_session_retry(_do)
+        return self._single_flight(self._inflight_dl, (folder, filename), lambda: self._with_session_retry(_do))
+
+    def download_models(self, folder, filenames, progress_callback=None):
+        """Download several model files concurrently. Returns local cache paths
+        in the same order as filenames.
+        progress_callback(bytes_downloaded, total_bytes) reports combined progress
+        across the files being fetched."""
+        filenames = list(filenames)
+        progress = {}
+        progress_lock = threading.Lock()
+
+        def _one(filename):
+            def on_progress(downloaded, total):
+                with progress_lock:
+                    progress[filename] = (downloaded, total)
+                    progress_callback(
+                        sum(d for d, _t in progress.values()),
+                        sum(t for _d, t in progress.values()),
+                    )
+            return filename, self.download_model(
+                folder, filename, progress_callback=on_progress if progress_callback else None,
+            )
+
+        unique = list(dict.fromkeys(filenames))
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY, thread_name_prefix="synology-download") as pool:
+            paths = dict(pool.map(_one, unique))
+        return [paths[f] for f in filenames]
 
 # ---------------------------------------------------------------------------
 # Module-level singleton
@@ -458,29 +1111,98 @@ class SynologyClient:
 
 _client = None
 _client_lock = threading.Lock()
+_client_ready = threading.Event()  # set once startup auto-login has finished or was skipped
+
+def _auto_login(client, api_url, username, password):
+    try:
+        client.login(username, password, api_url)
+        logger.info("Auto-login from config/environment succeeded")
+    except Exception as e:
+        logger.warning(f"Auto-login failed: {e}")
+        return
+    finally:
+        _client_ready.set()
+    client.prewarm()
+
 
 def get_client():
-    """Lazy singleton factory for the Synology client."""
+    """Lazy singleton factory for the Synology client.
+    Never blocks on the network: auto-login from config/env runs on a
+    background thread (use wait_for_client() when authentication must have
+    settled)."""
     global _client
-    if _client is None:
-        with _client_lock:
-            if _client is None:
-                config = load_config()
-                cache_dir = config.get("cache_dir") or _default_cache_dir()
-                _client = SynologyClient(cache_dir=cache_dir)
-                _client._models_base_path = config.get("models_base_path", "/volume1/models")
-                folder_paths = config.get("folder_paths", {})
-                if folder_paths:
-                    _client._folder_paths = {k: v for k, v in folder_paths.items() if v}
-
-                # Auto-login if credentials are available from config/env
-                api_url = config.get("api_url")
-                username = config.get("username")
-                password = config.get("password")
-                if api_url and username and password:
-                    try:
-                        _client.login(username, password, api_url)
-                        logger.info("Auto-login from config/environment succeeded")
-                    except Exception as e:
-                        logger.warning(f"Auto-login failed: {e}")
-    return _client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is not None:
+            return _client
+        config = load_config()
+        cache_dir = config.get("cache_dir") or _default_cache_dir()
+        verify = config.get("ca_bundle") or config.get("verify_ssl", False)
+        client = SynologyClient(cache_dir=cache_dir, verify_ssl=verify, config=config)
+        client._models_base_path = config.get("models_base_path", "/volume1/models")
+        folder_paths = config.get("folder_paths", {})
+        if folder_paths:
+            client._folder_paths = {k: v for k, v in folder_paths.items() if v}
+        _client = client
+        atexit.register(client.close)
+
+        # Auto-login if credentials are available from config/env
+        api_url = config.get("api_url")
+        username = config.get("username")
+        password = config.get("password")
+        if api_url and username and password:
+            threading.Thread(
+                target=_auto_login,
+                args=(client, api_url, username, password),
+                name="synology-auto-login",
+                daemon=True,
+            ).start()
+        else:
+            _client_ready.set()
+    return client
+
+
+def wait_for_client(timeout=None):
+    """Return the client once startup auto-login has finished (or timeout elapsed)."""
+    client = get_client()
+    _client_ready.wait(timeout)
+    return client
+
+_model_lists = {}  # folder -> (auth_version, expires_at, models) for get_model_list_safe
+
+def get_model_list_safe(folder):
+    """Model list for a loader dropdown, with placeholder entries instead of
+    exceptions. Lists are reused for MODEL_LIST_TTL seconds (placeholders for
+    PLACEHOLDER_TTL) while the client's auth_version is unchanged, shared by
+    every node module. Waits at most CLIENT_READY_WAIT for startup auto-login;
+    the login bumps auth_version, so a placeholder shown meanwhile is replaced
+    on the next call."""
+    now = time.monotonic()
+    try:
+        client = wait_for_client(CLIENT_READY_WAIT)
+    except Exception as e:
+        logger.warning(f"Failed to create Synology client: {e}")
+        return ["(error loading models)"]
+    version = client.auth_version
+    cached = _model_lists.get(folder)
+    if cached and cached[0] == version and now < cached[1]:
+        return cached[2]
+
+    ttl = PLACEHOLDER_TTL
+    try:
+        if not client.authenticated:
+            models = ["(login required)"]
+        else:
+            models = client.list_models(folder)
+            if models:
+                ttl = MODEL_LIST_TTL
+            else:
+                models = ["(no models found)"]
+    except SynologyAuthError:
+        models = ["(login required)"]
+    except Exception as e:
+        logger.warning(f"Failed to list models in {folder}: {e}")
+        models = ["(error loading models)"]
+    _model_lists[folder] = (version, now + ttl, models)
+    return models
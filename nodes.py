@@ -1,8 +1,21 @@
 import os
-import logging
-from .client import get_client, SynologyAuthError
-
-logger = logging.getLogger("comfyui-synology")
+import time
+import itertools
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import torch
+    import comfy.sd
+    import comfy.utils
+    import comfy.controlnet
+    import comfy.clip_vision
+except ImportError:
+    pass  # only importable inside ComfyUI, which is the only place the loaders run
+
+from .client import DOWNLOAD_CONCURRENCY, get_client, get_model_list_safe, wait_for_client
 
 # ---------------------------------------------------------------------------
 # Flexible input type helpers (for dynamic LoRA inputs)
@@ -10,6 +23,7 @@ logger = logging.getLogger("comfyui-synology")
 
 class AnyType(str):
     """Matches any ComfyUI type for flexible inputs."""
+    __slots__ = ()
     def __ne__(self, __value):
         return False
 
@@ -17,103 +31,191 @@ any_type = AnyType("*")
 
 class FlexibleOptionalInputType(dict):
     """Dict that accepts any key, returning (any_type,) for unknowns."""
+    __slots__ = ()
+    _ANY = (any_type,)  # shared, so lookups don't allocate a tuple each time
     def __contains__(self, key):
         return True
     def __getitem__(self, key):
-        return (any_type,)
+        return self._ANY
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _get_model_list(folder):
-    """Fetch model list from Synology, with graceful fallback."""
+WEIGHT_DTYPES = ["default", "fp8_e4m3fn", "fp8_e4m3fn_fast", "fp8_e5m2"]
+
+def _weight_dtype_options(weight_dtype):
+    """model_options for a weight_dtype dropdown value."""
+    model_options = {}
+    if weight_dtype == "fp8_e4m3fn":
+        model_options["dtype"] = torch.float8_e4m3fn
+    elif weight_dtype == "fp8_e4m3fn_fast":
+        model_options["dtype"] = torch.float8_e4m3fn
+        model_options["fp8_optimizations"] = True
+    elif weight_dtype == "fp8_e5m2":
+        model_options["dtype"] = torch.float8_e5m2
+    return model_options
+
+# CLIPLoader "type" choices; each is the lowercased name of a comfy.sd.CLIPType member.
+CLIP_TYPES = ["stable_diffusion", "stable_cascade", "sd3", "stable_audio", "mochi", "ltxv", "pixart", "flux", "hunyuan_video", "cosmos", "lumina2"]
+
+_clip_types = None  # CLIP_TYPES value -> comfy.sd.CLIPType, built on first use
+
+def _clip_type_map():
+    global _clip_types
+    if _clip_types is None:
+        _clip_types = {name: getattr(comfy.sd.CLIPType, name.upper()) for name in CLIP_TYPES}
+    return _clip_types
+
+# Min seconds between progress bar updates sent to the UI (completion always goes out).
+_PROGRESS_INTERVAL = 0.1
+
+def _make_progress_cb():
+    """Return a download progress_callback driving a new 0-100 ProgressBar.
+    Updates are only sent when the whole percentage changes, and at most
+    once per _PROGRESS_INTERVAL."""
+    pbar = comfy.utils.ProgressBar(100)
+    last_pct = -1
+    last_sent = 0.0
+
+    def on_progress(downloaded, total):
+        nonlocal last_pct, last_sent
+        pct = downloaded * 100 // max(total, 1)
+        if pct == last_pct:
+            return
+        now = time.monotonic()
+        if pct < 100 and now - last_sent < _PROGRESS_INTERVAL:
+            return
+        last_pct = pct
+        last_sent = now
+        pbar.update_absolute(pct, 100)
+
+    return on_progress
+
+def _load_sd(path, safe_load=True, mmap=True):
+    """Load a state dict from a cached model file.
+    safetensors files are read straight through safe_open, which maps the file
+    and copies out one tensor at a time; pickled checkpoints are memory-mapped
+    so tensors are paged in from the file instead of being read into RAM up front.
+    Pass mmap=False for state dicts kept across runs: mapped tensors hold the
+    file open, and on Windows a mapped file can't be deleted or replaced."""
+    if path.lower().endswith((".safetensors", ".sft")):
+        try:
+            from safetensors import safe_open
+        except ImportError:
+            return comfy.utils.load_torch_file(path, safe_load=safe_load)
+        with safe_open(path, framework="pt", device="cpu") as f:
+            return {k: f.get_tensor(k) for k in f.keys()}
+
     try:
-        client = get_client()
-        if not client.authenticated:
-            return ["(login required)"]
-        models = client.list_models(folder)
-        return models if models else ["(no models found)"]
-    except SynologyAuthError:
-        return ["(login required)"]
-    except Exception as e:
-        logger.warning(f"Failed to list models in {folder}: {e}")
-        return ["(error loading models)"]
+        sd = torch.load(path, map_location="cpu", mmap=mmap, weights_only=safe_load)
+    except (RuntimeError, TypeError):
+        # Legacy (non-zip) pickles can't be mapped, and torch < 2.1 has no mmap=
+        return comfy.utils.load_torch_file(path, safe_load=safe_load)
+    # Same unwrapping as comfy.utils.load_torch_file
+    if isinstance(sd, dict):
+        if "state_dict" in sd:
+            sd = sd["state_dict"]
+        elif len(sd) == 1:
+            inner = next(iter(sd.values()))
+            if isinstance(inner, dict):
+                sd = inner
+    return sd
+
+# ---------------------------------------------------------------------------
+# Loader base
+# ---------------------------------------------------------------------------
+
+# Built loader outputs kept by _SynologyLoaderBase._load_cached, least recently used evicted first.
+MAX_LOADED_OBJECTS = 4
+_loaded_objects = OrderedDict()  # (node class, name, size, mtime_ns) -> load() result
+_loaded_objects_lock = threading.Lock()
+
+class _SynologyLoaderBase:
+    """Shared plumbing for nodes that load models from one NAS model folder."""
+    FUNCTION = "load"
+    CATEGORY = "loaders/synology"
+    FOLDER = ""  # model folder name, as used by SynologyClient
+    # Reuse built outputs across runs via _load_cached. Only for loaders whose
+    # outputs are small and safe to share; models that pin VRAM stay off.
+    CACHE_LOADED = False
+
+    @classmethod
+    def IS_CHANGED(cls, **kwargs):
+        return get_client().auth_version
+
+    def _download(self, name):
+        """Fetch name from FOLDER into the local cache with a progress bar; returns the local path."""
+        return wait_for_client().download_model(self.FOLDER, name, progress_callback=_make_progress_cb())
+
+    def _load_cached(self, name, build):
+        """Download name and return build(local_path), reusing the result of an
+        earlier build while the cached file is unchanged (same size and mtime;
+        a re-download replaces the file and so misses)."""
+        local_path = self._download(name)
+        if not self.CACHE_LOADED:
+            return build(local_path)
+        st = os.stat(local_path)
+        key = (type(self).__name__, name, st.st_size, st.st_mtime_ns)
+        with _loaded_objects_lock:
+            if key in _loaded_objects:
+                _loaded_objects.move_to_end(key)
+                return _loaded_objects[key]
+        result = build(local_path)
+        with _loaded_objects_lock:
+            _loaded_objects[key] = result
+            while len(_loaded_objects) > MAX_LOADED_OBJECTS:
+                _loaded_objects.popitem(last=False)
+        return result
 
 # ---------------------------------------------------------------------------
 # Checkpoint Loader
 # ---------------------------------------------------------------------------
 
-class SynologyCheckpointLoader:
+class SynologyCheckpointLoader(_SynologyLoaderBase):
     RETURN_TYPES = ("MODEL", "CLIP", "VAE")
     RETURN_NAMES = ("model", "clip", "vae")
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "checkpoints"
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "ckpt_name": (_get_model_list("checkpoints"),),
-            }
+                "ckpt_name": (get_model_list_safe(cls.FOLDER),),
+            },
+            "optional": {
+                "weight_dtype": (WEIGHT_DTYPES, {"default": "default"}),
+            },
         }
 
-    @classmethod
-    def IS_CHANGED(cls, ckpt_name):
-        return get_client().auth_version
-
-    def load(self, ckpt_name):
-        import comfy.sd
-        import comfy.utils
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("checkpoints", ckpt_name, progress_callback=on_progress)
-        return comfy.sd.load_checkpoint_guess_config(local_path)[:3]
+    def load(self, ckpt_name, weight_dtype="default"):
+        local_path = self._download(ckpt_name)
+        return comfy.sd.load_checkpoint_guess_config(
+            local_path, model_options=_weight_dtype_options(weight_dtype),
+        )[:3]
 
 # ---------------------------------------------------------------------------
 # Diffusion Model Loader (UNET)
 # ---------------------------------------------------------------------------
 
-class SynologyDiffusionModelLoader:
+class SynologyDiffusionModelLoader(_SynologyLoaderBase):
     RETURN_TYPES = ("MODEL",)
     RETURN_NAMES = ("model",)
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "diffusion_models"
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "unet_name": (_get_model_list("diffusion_models"),),
-                "weight_dtype": (["default", "fp8_e4m3fn", "fp8_e4m3fn_fast", "fp8_e5m2"],),
+                "unet_name": (get_model_list_safe(cls.FOLDER),),
+                "weight_dtype": (WEIGHT_DTYPES,),
             }
         }
 
-    @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return get_client().auth_version
-
     def load(self, unet_name, weight_dtype):
-        import torch
-        import comfy.sd
-        import comfy.utils
-
-        model_options = {}
-        if weight_dtype == "fp8_e4m3fn":
-            model_options["dtype"] = torch.float8_e4m3fn
-        elif weight_dtype == "fp8_e4m3fn_fast":
-            model_options["dtype"] = torch.float8_e4m3fn
-            model_options["fp8_optimizations"] = True
-        elif weight_dtype == "fp8_e5m2":
-            model_options["dtype"] = torch.float8_e5m2
+        model_options = _weight_dtype_options(weight_dtype)
 
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("diffusion_models", unet_name, progress_callback=on_progress)
+        local_path = self._download(unet_name)
         model = comfy.sd.load_diffusion_model(local_path, model_options=model_options)
         return (model,)
 
@@ -121,22 +223,24 @@ class SynologyDiffusionModelLoader:
 # LoRA Loader (single)
 # ---------------------------------------------------------------------------
 
-class SynologyLoRALoader:
+class SynologyLoRALoader(_SynologyLoaderBase):
     RETURN_TYPES = ("MODEL", "CLIP")
     RETURN_NAMES = ("model", "clip")
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "loras"
 
     def __init__(self):
         self.loaded_lora = None
         self.loaded_lora_name = None
+        self._last_key = None  # (lora_name, strength_model, strength_clip) of _last_result
+        self._last_refs = None  # weakrefs to the model/clip _last_result was patched from
+        self._last_result = None
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "model": ("MODEL",),
-                "lora_name": (_get_model_list("loras"),),
+                "lora_name": (get_model_list_safe(cls.FOLDER),),
                 "strength_model": ("FLOAT", {"default": 1.0, "min": -20.0, "max": 20.0, "step": 0.05}),
                 "strength_clip": ("FLOAT", {"default": 1.0, "min": -20.0, "max": 20.0, "step": 0.05}),
             },
@@ -145,37 +249,52 @@ class SynologyLoRALoader:
             },
         }
 
-    @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return get_client().auth_version
-
     def load(self, model, lora_name, strength_model, strength_clip, clip=None):
-        import comfy.utils
-        import comfy.sd
-
         if self.loaded_lora_name != lora_name:
-            client = get_client()
-            pbar = comfy.utils.ProgressBar(100)
-            def on_progress(downloaded, total):
-                pbar.update_absolute(int(downloaded * 100 / total), 100)
-            local_path = client.download_model("loras", lora_name, progress_callback=on_progress)
-            self.loaded_lora = comfy.utils.load_torch_file(local_path, safe_load=True)
+            # Release the previous LoRA first so both aren't resident while the new one loads
+            self.loaded_lora = None
+            self.loaded_lora_name = None
+            self._last_key = self._last_refs = self._last_result = None
+            local_path = self._download(lora_name)
+            self.loaded_lora = _load_sd(local_path, mmap=False)
             self.loaded_lora_name = lora_name
 
-        return comfy.sd.load_lora_for_models(model, clip, self.loaded_lora, strength_model, strength_clip)
+        # Re-patching walks every LoRA key, so repeat calls on the same
+        # model/clip reuse the last result. Weakrefs keep the inputs'
+        # lifetime unchanged; a dead ref simply misses.
+        key = (lora_name, round(strength_model, 4), round(strength_clip, 4))
+        if (key == self._last_key and self._last_refs[0]() is model
+                and (self._last_refs[1]() if self._last_refs[1] else None) is clip):
+            return self._last_result
+
+        result = comfy.sd.load_lora_for_models(model, clip, self.loaded_lora, strength_model, strength_clip)
+        try:
+            refs = (weakref.ref(model), weakref.ref(clip) if clip is not None else None)
+        except TypeError:
+            # Not weak-referenceable; don't risk matching a recycled id()
+            self._last_key = self._last_refs = self._last_result = None
+        else:
+            self._last_key, self._last_refs, self._last_result = key, refs, result
+        return result
 
 # ---------------------------------------------------------------------------
 # Multi-LoRA Loader (Power LoRA style)
 # ---------------------------------------------------------------------------
 
-class SynologyMultiLoRALoader:
+class SynologyMultiLoRALoader(_SynologyLoaderBase):
     RETURN_TYPES = ("MODEL", "CLIP")
     RETURN_NAMES = ("model", "clip")
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "loras"
+
+    # Seconds a LoRA that failed to download is reported as failed without retrying.
+    FAILED_RETRY_DELAY = 30.0
+    # LoRA state dicts kept between runs, least recently used evicted first.
+    # A single run's stack is always kept whole, even if it is larger.
+    MAX_CACHED_LORAS = 8
 
     def __init__(self):
-        self.loaded_loras = {}  # name -> loaded lora data
+        self.loaded_loras = OrderedDict()  # name -> loaded lora data, oldest first
+        self._failed_loras = {}  # name -> (auth_version, retry_at, exception) of a failed fetch
 
     @classmethod
     def INPUT_TYPES(cls):
@@ -192,19 +311,18 @@ class SynologyMultiLoRALoader:
     def VALIDATE_INPUTS(cls, **kwargs):
         return True
 
-    @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return get_client().auth_version
-
     def load(self, model, clip=None, **kwargs):
-        import comfy.utils
-        import comfy.sd
-
-        for key in sorted(kwargs.keys()):
-            if not key.startswith("lora_"):
-                continue
-
-            value = kwargs[key]
+        # Slot widgets are named lora_1..lora_N; order them numerically so
+        # lora_10 follows lora_9 rather than lora_1.
+        slot_values = {}
+        for key, value in kwargs.items():
+            if key.startswith("lora_"):
+                index = key[5:]
+                slot_values[(0, int(index)) if index.isdigit() else (1, index)] = value
+
+        slots = []  # (lora_name, strength_model, strength_clip) of slots to apply
+        enabled = set()  # every LoRA switched on, including zero-strength ones
+        for _index, value in sorted(slot_values.items()):
 
             # Accept structured {on, lora, strength, strengthTwo} dicts from the frontend
             if isinstance(value, dict):
@@ -221,21 +339,64 @@ class SynologyMultiLoRALoader:
 
             if not on or lora_name == "None":
                 continue
+            enabled.add(lora_name)
             if clip is None:
                 strength_clip = 0
+            # A zero-strength slot is a no-op; don't download or load it
+            if strength_model == 0 and strength_clip == 0:
+                continue
+            slots.append((lora_name, strength_model, strength_clip))
+
+        missing = list(dict.fromkeys(name for name, _sm, _sc in slots if name not in self.loaded_loras))
+
+        # Mark this run's LoRAs (zero-strength ones too, so scrubbing back up is
+        # instant) as most recent, then evict the oldest others to make room.
+        for name in enabled:
+            if name in self.loaded_loras:
+                self.loaded_loras.move_to_end(name)
+        limit = max(self.MAX_CACHED_LORAS, len(enabled))
+        while self.loaded_loras and len(self.loaded_loras) + len(missing) > limit:
+            self.loaded_loras.popitem(last=False)
+
+        # Fetch and load every uncached LoRA concurrently, each one loading as
+        # soon as its download finishes; applying stays sequential below.
+        if missing:
+            client = wait_for_client()
+            report = _make_progress_cb()
+            progress = {}  # lora_name -> (downloaded, total)
+            progress_lock = threading.Lock()
+
+            def fetch(lora_name):
+                failed = self._failed_loras.get(lora_name)
+                if failed and failed[0] == client.auth_version and time.monotonic() < failed[1]:
+                    raise failed[2]
 
-            if lora_name not in self.loaded_loras:
-                client = get_client()
-                pbar = comfy.utils.ProgressBar(100)
                 def on_progress(downloaded, total):
-                    pbar.update_absolute(int(downloaded * 100 / total), 100)
-                local_path = client.download_model("loras", lora_name, progress_callback=on_progress)
-                self.loaded_loras[lora_name] = comfy.utils.load_torch_file(local_path, safe_load=True)
-
-            if strength_model != 0 or strength_clip != 0:
-                model, clip = comfy.sd.load_lora_for_models(
-                    model, clip, self.loaded_loras[lora_name], strength_model, strength_clip,
-                )
+                    with progress_lock:
+                        progress[lora_name] = (downloaded, total)
+                        report(
+                            sum(d for d, _t in progress.values()),
+                            sum(t for _d, t in progress.values()),
+                        )
+                try:
+                    local_path = client.download_model(self.FOLDER, lora_name, progress_callback=on_progress)
+                except Exception as e:
+                    self._failed_loras[lora_name] = (
+                        client.auth_version, time.monotonic() + self.FAILED_RETRY_DELAY, e,
+                    )
+                    raise
+                self._failed_loras.pop(lora_name, None)
+                return _load_sd(local_path, mmap=False)
+
+            workers = min(DOWNLOAD_CONCURRENCY, len(missing))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="synology-lora") as pool:
+                for lora_name, sd in zip(missing, pool.map(fetch, missing)):
+                    self.loaded_loras[lora_name] = sd
+
+        for lora_name, strength_model, strength_clip in slots:
+            model, clip = comfy.sd.load_lora_for_models(
+                model, clip, self.loaded_loras[lora_name], strength_model, strength_clip,
+            )
 
         return (model, clip)
 
@@ -243,67 +404,42 @@ class SynologyMultiLoRALoader:
 # VAE Loader
 # ---------------------------------------------------------------------------
 
-class SynologyVAELoader:
+class SynologyVAELoader(_SynologyLoaderBase):
     RETURN_TYPES = ("VAE",)
     RETURN_NAMES = ("vae",)
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "vae"
+    CACHE_LOADED = True
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "vae_name": (_get_model_list("vae"),),
+                "vae_name": (get_model_list_safe(cls.FOLDER),),
             }
         }
 
-    @classmethod
-    def IS_CHANGED(cls, vae_name):
-        return get_client().auth_version
-
     def load(self, vae_name):
-        import comfy.utils
-        import comfy.sd
-
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("vae", vae_name, progress_callback=on_progress)
-        sd = comfy.utils.load_torch_file(local_path)
-        return (comfy.sd.VAE(sd=sd),)
+        return self._load_cached(vae_name, lambda path: (comfy.sd.VAE(sd=_load_sd(path)),))
 
 # ---------------------------------------------------------------------------
 # ControlNet Loader
 # ---------------------------------------------------------------------------
 
-class SynologyControlNetLoader:
+class SynologyControlNetLoader(_SynologyLoaderBase):
     RETURN_TYPES = ("CONTROL_NET",)
     RETURN_NAMES = ("control_net",)
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "controlnet"
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "control_net_name": (_get_model_list("controlnet"),),
+                "control_net_name": (get_model_list_safe(cls.FOLDER),),
             }
         }
 
-    @classmethod
-    def IS_CHANGED(cls, control_net_name):
-        return get_client().auth_version
-
     def load(self, control_net_name):
-        import comfy.controlnet
-        import comfy.utils
-
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("controlnet", control_net_name, progress_callback=on_progress)
+        local_path = self._download(control_net_name)
         return (comfy.controlnet.load_controlnet(local_path),)
 
 # ---------------------------------------------------------------------------
@@ -325,20 +461,17 @@ class SynologyClearCache:
             },
         }
 
+    _runs = itertools.count()  # IS_CHANGED token; the cache changes outside the graph
+
     @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return float("nan")
+    def IS_CHANGED(cls, confirm=False, **kwargs):
+        # A fresh token every queue so the report is never served from cache
+        return f"{confirm}:{next(cls._runs)}"
 
     def clear(self, confirm):
         if not confirm:
             client = get_client()
-            cache_dir = client.cache_dir
-            total = 0
-            if os.path.isdir(cache_dir):
-                for dirpath, _dirnames, filenames in os.walk(cache_dir):
-                    for f in filenames:
-                        total += os.path.getsize(os.path.join(dirpath, f))
-            size_mb = total / (1024 * 1024)
+            size_mb = client.cache_size() / (1024 * 1024)
             return (f"Cache: {size_mb:.1f} MB — set confirm to true to clear",)
 
         client = get_client()
@@ -350,149 +483,94 @@ class SynologyClearCache:
 # CLIP Loader
 # ---------------------------------------------------------------------------
 
-class SynologyCLIPLoader:
+class SynologyCLIPLoader(_SynologyLoaderBase):
     RETURN_TYPES = ("CLIP",)
     RETURN_NAMES = ("clip",)
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "clip"
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "clip_name": (_get_model_list("clip"),),
-                "type": (["stable_diffusion", "stable_cascade", "sd3", "stable_audio", "mochi", "ltxv", "pixart", "flux", "hunyuan_video", "cosmos", "lumina2"],),
-            }
+                "clip_name": (get_model_list_safe(cls.FOLDER),),
+                "type": (CLIP_TYPES,),
+            },
+            "optional": {
+                # Text encoders lose more from e5m2's short mantissa, so only e4m3fn is offered
+                "weight_dtype": (["default", "fp8_e4m3fn"], {"default": "default"}),
+            },
         }
 
-    @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return get_client().auth_version
+    def load(self, clip_name, type, weight_dtype="default"):
+        clip_type = _clip_type_map().get(type, comfy.sd.CLIPType.STABLE_DIFFUSION)
 
-    def load(self, clip_name, type):
-        import comfy.sd
-        import comfy.utils
-
-        clip_type_map = {
-            "stable_diffusion": comfy.sd.CLIPType.STABLE_DIFFUSION,
-            "stable_cascade": comfy.sd.CLIPType.STABLE_CASCADE,
-            "sd3": comfy.sd.CLIPType.SD3,
-            "stable_audio": comfy.sd.CLIPType.STABLE_AUDIO,
-            "mochi": comfy.sd.CLIPType.MOCHI,
-            "ltxv": comfy.sd.CLIPType.LTXV,
-            "pixart": comfy.sd.CLIPType.PIXART,
-            "flux": comfy.sd.CLIPType.FLUX,
-            "hunyuan_video": comfy.sd.CLIPType.HUNYUAN_VIDEO,
-            "cosmos": comfy.sd.CLIPType.COSMOS,
-            "lumina2": comfy.sd.CLIPType.LUMINA2,
-        }
-        clip_type = clip_type_map.get(type, comfy.sd.CLIPType.STABLE_DIFFUSION)
-
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("clip", clip_name, progress_callback=on_progress)
-        clip = comfy.sd.load_clip(ckpt_paths=[local_path], embedding_directory=None, clip_type=clip_type)
+        local_path = self._download(clip_name)
+        clip = comfy.sd.load_clip(
+            ckpt_paths=[local_path], embedding_directory=None, clip_type=clip_type,
+            model_options=_weight_dtype_options(weight_dtype),
+        )
         return (clip,)
 
 # ---------------------------------------------------------------------------
 # Embeddings Loader
 # ---------------------------------------------------------------------------
 
-class SynologyEmbeddingsLoader:
+class SynologyEmbeddingsLoader(_SynologyLoaderBase):
     RETURN_TYPES = ("STRING",)
     RETURN_NAMES = ("embedding_path",)
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "embeddings"
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "embedding_name": (_get_model_list("embeddings"),),
+                "embedding_name": (get_model_list_safe(cls.FOLDER),),
             }
         }
 
-    @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return get_client().auth_version
-
     def load(self, embedding_name):
-        import comfy.utils
-
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("embeddings", embedding_name, progress_callback=on_progress)
+        local_path = self._download(embedding_name)
         return (local_path,)
 
 # ---------------------------------------------------------------------------
 # Upscaler Loader
 # ---------------------------------------------------------------------------
 
-class SynologyUpscalerLoader:
+class SynologyUpscalerLoader(_SynologyLoaderBase):
     RETURN_TYPES = ("UPSCALE_MODEL",)
     RETURN_NAMES = ("upscale_model",)
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "upscale_models"
+    CACHE_LOADED = True
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "model_name": (_get_model_list("upscale_models"),),
+                "model_name": (get_model_list_safe(cls.FOLDER),),
             }
         }
 
-    @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return get_client().auth_version
-
     def load(self, model_name):
-        import comfy.utils
         from comfy_extras.chainner_models import model_loading
 
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("upscale_models", model_name, progress_callback=on_progress)
-        sd = comfy.utils.load_torch_file(local_path, safe_load=True)
-        out = model_loading.load_state_dict(sd).eval()
-        return (out,)
+        return self._load_cached(model_name, lambda path: (model_loading.load_state_dict(_load_sd(path)).eval(),))
 
 # ---------------------------------------------------------------------------
 # CLIP Vision Loader
 # ---------------------------------------------------------------------------
 
-class SynologyCLIPVisionLoader:
+class SynologyCLIPVisionLoader(_SynologyLoaderBase):
     RETURN_TYPES = ("CLIP_VISION",)
     RETURN_NAMES = ("clip_vision",)
-    FUNCTION = "load"
-    CATEGORY = "loaders/synology"
+    FOLDER = "clip_vision"
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "clip_name": (_get_model_list("clip_vision"),),
+                "clip_name": (get_model_list_safe(cls.FOLDER),),
             }
         }
 
-    @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return get_client().auth_version
-
     def load(self, clip_name):
-        import comfy.clip_vision
-        import comfy.utils
-
-        client = get_client()
-        pbar = comfy.utils.ProgressBar(100)
-        def on_progress(downloaded, total):
-            pbar.update_absolute(int(downloaded * 100 / total), 100)
-        local_path = client.download_model("clip_vision", clip_name, progress_callback=on_progress)
-        clip_vision = comfy.clip_vision.load(local_path)
-        return (clip_vision,)
+        return self._load_cached(clip_name, lambda path: (comfy.clip_vision.load(path),))